@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+from datetime import date
+from itertools import batched
 from typing import Final
 
 import voluptuous as vol
@@ -13,6 +17,7 @@ from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
+    ConfigEntryError,
     ConfigEntryNotReady,
     ServiceValidationError,
 )
@@ -30,12 +35,13 @@ from pycalista_ista import (
 
 from .const import (
     CONF_LOG_LEVEL,
+    CONF_OFFSET,
     DEFAULT_LOG_LEVEL,
     DOMAIN,
     LOG_LEVELS,
     PLATFORMS,
 )
-from .coordinator import IstaCoordinator
+from .coordinator import IstaCoordinator, get_history_store, statistic_id
 
 type IstaConfigEntry = ConfigEntry[IstaCoordinator]
 
@@ -48,18 +54,29 @@ MODEL_TO_KEY_MAP: Final[dict[str, str]] = {
     "Heating Meter": "heating",
 }
 
+# Maximum number of statistic IDs cleared in a single recorder job.
+CLEAR_STATISTICS_BATCH_SIZE: Final[int] = 500
+
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the ista Calista component."""
-    hass.data.setdefault(DOMAIN, {})
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> bool:
     """Set up ista Calista from a config entry."""
     _LOGGER.debug("Setting up config entry: %s", entry.entry_id)
+    try:
+        init_date = date.fromisoformat(entry.data[CONF_OFFSET])
+    except ValueError as err:
+        raise ConfigEntryError(
+            translation_domain=DOMAIN,
+            translation_key="invalid_offset_date",
+            translation_placeholders={"offset": entry.data[CONF_OFFSET]},
+        ) from err
+
     session = async_get_clientsession(hass)
     ista = PyCalistaIsta(entry.data[CONF_EMAIL], entry.data[CONF_PASSWORD], session)
 
@@ -85,12 +102,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> bool
         # This should not happen with the SelectSelector, but is a safeguard.
         _LOGGER.error("Failed to set log level: %s", err)
 
+    coordinator = IstaCoordinator(hass, entry, ista, init_date)
+
     try:
         _LOGGER.debug(
             "Attempting to log in to Ista Calista API for account: %s",
             entry.data[CONF_EMAIL],
         )
-        await ista.login()
+        # Read the cached history from disk while the login is in flight.
+        await asyncio.gather(
+            coordinator.async_login(), coordinator.async_load_history()
+        )
         _LOGGER.info("Successfully logged in for account %s", entry.data[CONF_EMAIL])
     except IstaLoginError as err:
         _LOGGER.warning("Authentication failed for %s", entry.data[CONF_EMAIL])
@@ -108,9 +130,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> bool
         _LOGGER.exception("Unexpected error during ista Calista setup")
         raise ConfigEntryNotReady(f"Unexpected error during setup: {err}") from err
 
-    coordinator = IstaCoordinator(hass, entry, ista)
     entry.runtime_data = coordinator
-    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await coordinator.async_config_entry_first_refresh()
 
@@ -127,7 +147,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> bool
 
         # Find invoice object to get date for filename
         invoice = None
-        for coord in hass.data[DOMAIN].values():
+        for loaded_entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            coord = loaded_entry.runtime_data
             if not coord.data or "invoices" not in coord.data:
                 continue
             invoice = next(
@@ -165,16 +186,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> bool
 
         # Save to www directory
         base_path = hass.config.path("www")
-        import os
-        if not os.path.exists(base_path):
-             os.makedirs(base_path)
-             
         filepath = os.path.join(base_path, filename)
-        
-        def save_file():
+
+        def save_file() -> None:
+            if not os.path.exists(base_path):
+                os.makedirs(base_path)
             with open(filepath, "wb") as f:
                 f.write(content)
-        
+
         await hass.async_add_executor_job(save_file)
         _LOGGER.info("Saved invoice to %s", filepath)
         
@@ -200,7 +219,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> bool
         """Return a detailed list of invoices."""
         _LOGGER.debug("Service called: get_invoices")
         all_invoices: list[dict] = []
-        for coord in hass.data[DOMAIN].values():
+        for loaded_entry in hass.config_entries.async_loaded_entries(DOMAIN):
+            coord = loaded_entry.runtime_data
             if coord.data and "invoices" in coord.data:
                 for inv in coord.data["invoices"]:
                     all_invoices.append({
@@ -248,7 +268,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: IstaConfigEntry) -> boo
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = entry.runtime_data
         await coordinator.ista.close()
-        hass.data[DOMAIN].pop(entry.entry_id, None)
         _LOGGER.info("Successfully unloaded config entry: %s", entry.entry_id)
 
     return unload_ok
@@ -261,6 +280,8 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         entry.entry_id,
     )
 
+    await get_history_store(hass, entry.entry_id).async_remove()
+
     device_registry = dr.async_get(hass)
     devices_for_entry = dr.async_entries_for_config_entry(
         device_registry, entry.entry_id
@@ -291,14 +312,7 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
             )
             continue
 
-        serial_number = next(
-            (
-                identifier
-                for domain, identifier in device.identifiers
-                if domain == DOMAIN
-            ),
-            None,
-        )
+        serial_number = dict(device.identifiers).get(DOMAIN)
 
         if not serial_number:
             _LOGGER.warning(
@@ -308,11 +322,7 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
             )
             continue
 
-        # We replace them with underscores to match the sensor's statistic_id generation.
-        slug_serial_number = serial_number.replace("-", "_")
-        sensor_unique_id = f"{slug_serial_number}_{sensor_key}"
-        statistic_id = f"{DOMAIN}:{sensor_unique_id}"
-        statistic_ids_to_clear.append(statistic_id)
+        statistic_ids_to_clear.append(statistic_id(serial_number, sensor_key))
 
     if statistic_ids_to_clear:
         _LOGGER.debug(
@@ -322,7 +332,9 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         )
         recorder_instance = get_instance(hass)
         if recorder_instance:
-            recorder_instance.async_clear_statistics(statistic_ids_to_clear)
+            # Keep each recorder transaction small for accounts with many meters.
+            for batch in batched(statistic_ids_to_clear, CLEAR_STATISTICS_BATCH_SIZE):
+                recorder_instance.async_clear_statistics(list(batch))
             _LOGGER.info(
                 "Successfully scheduled clearing of %d statistic(s) for config entry %s.",
                 len(statistic_ids_to_clear),
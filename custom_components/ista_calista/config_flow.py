@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import calendar
 import logging
+from collections.abc import Mapping
 from datetime import date
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
-from dateutil.relativedelta import relativedelta
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -59,16 +61,143 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+def _months_before(day: date, months: int) -> date:
+    """Return the same day `months` earlier, clamped to the end of the month."""
+    year, month_index = divmod(day.year * 12 + day.month - 1 - months, 12)
+    month = month_index + 1
+    return day.replace(
+        year=year, month=month, day=min(day.day, calendar.monthrange(year, month)[1])
+    )
+
+
+@lru_cache(maxsize=2)
+def _offset_defaults(today_ordinal: int) -> tuple[str, date]:
+    """Return the default offset (ISO) and minimum offset date for a given day."""
+    today = date.fromordinal(today_ordinal)
+    default_offset = _months_before(today, 12)
+    min_offset = _months_before(today, 1)
+    return default_offset.isoformat(), min_offset
+
+
 def get_default_offset_date() -> str:
     """Return the default offset date (1 year ago)."""
-    result: date = dt_util.now().date() - relativedelta(years=1)
-    return result.isoformat()
+    return _offset_defaults(dt_util.now().date().toordinal())[0]
+
+
+@lru_cache(maxsize=8)
+def _season_start_default(year: int, month: int, day: int) -> str:
+    """Return the ISO date of the season start in the given year."""
+    return f"{year}-{month:02d}-{day:02d}"
 
 
-def get_min_offset_date() -> date:
-    """Return the minimum allowed offset date (1 month ago)."""
-    result: date = dt_util.now().date() - relativedelta(months=1)
-    return result
+def _season_start_from(data: Mapping[str, Any], year: int) -> str:
+    """Return the season start in `year`, honouring legacy month/day settings."""
+    return _season_start_default(
+        year,
+        data.get(CONF_SEASON_START_MONTH, DEFAULT_SEASON_START_MONTH),
+        data.get(CONF_SEASON_START_DAY, DEFAULT_SEASON_START_DAY),
+    )
+
+
+@lru_cache(maxsize=8)
+def _validate_offset_str(offset: str, today_ordinal: int) -> str | None:
+    """Return the error key for an offset date string, or None if it is valid."""
+    try:
+        offset_date = date.fromisoformat(offset)
+    except ValueError:
+        return "invalid_date_format"
+    if offset_date > _offset_defaults(today_ordinal)[1]:
+        return "offset_too_recent"
+    return None
+
+
+_EMAIL_SELECTOR = TextSelector(
+    TextSelectorConfig(type=TextSelectorType.EMAIL, autocomplete="email")
+)
+_PASSWORD_SELECTOR = TextSelector(
+    TextSelectorConfig(type=TextSelectorType.PASSWORD, autocomplete="current-password")
+)
+_DATE_SELECTOR = DateSelector(DateSelectorConfig())
+_UPDATE_INTERVAL_SELECTOR = NumberSelector(
+    NumberSelectorConfig(
+        min=MIN_UPDATE_INTERVAL_HOURS,
+        max=MAX_UPDATE_INTERVAL_HOURS,
+        step=1,
+        mode=NumberSelectorMode.SLIDER,
+        unit_of_measurement="hours",
+    )
+)
+_LOG_LEVEL_SELECTOR = SelectSelector(
+    SelectSelectorConfig(options=LOG_LEVELS, mode=SelectSelectorMode.DROPDOWN)
+)
+
+_RECONFIGURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EMAIL): _EMAIL_SELECTOR,
+        vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
+        vol.Required(CONF_OFFSET): _DATE_SELECTOR,
+        vol.Required(CONF_SEASON_START): _DATE_SELECTOR,
+    }
+)
+_REAUTH_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR})
+
+
+@lru_cache(maxsize=1)
+def _user_schema(season_start_default: str) -> vol.Schema:
+    """Return the schema for the user step."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_EMAIL): _EMAIL_SELECTOR,
+            vol.Required(CONF_PASSWORD): _PASSWORD_SELECTOR,
+            vol.Required(CONF_OFFSET): _DATE_SELECTOR,
+            vol.Required(
+                CONF_SEASON_START, default=season_start_default
+            ): _DATE_SELECTOR,
+        }
+    )
+
+
+def _options_schema(
+    update_interval: int, log_level: str, season_start: str
+) -> vol.Schema:
+    """Return the schema for the options step with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_UPDATE_INTERVAL, default=update_interval): (
+                _UPDATE_INTERVAL_SELECTOR
+            ),
+            vol.Optional(CONF_LOG_LEVEL, default=log_level): _LOG_LEVEL_SELECTOR,
+            vol.Optional(CONF_SEASON_START, default=season_start): _DATE_SELECTOR,
+        }
+    )
+
+
+def _validate_local(user_input: dict[str, Any]) -> dict[str, str]:
+    """Validate the settings that can be checked without calling the API."""
+    errors: dict[str, str] = {}
+    if CONF_OFFSET in user_input:
+        offset = user_input[CONF_OFFSET]
+        today_ordinal = dt_util.now().date().toordinal()
+        # The suggested default is valid by construction; skip parsing it.
+        offset_error = (
+            None
+            if offset == _offset_defaults(today_ordinal)[0]
+            else _validate_offset_str(offset, today_ordinal)
+        )
+        if offset_error == "offset_too_recent":
+            _LOGGER.warning(
+                "Validation failed: Offset date %s is more recent than minimum allowed %s.",
+                offset,
+                _offset_defaults(today_ordinal)[1],
+            )
+            errors[CONF_OFFSET] = offset_error
+        elif offset_error:
+            _LOGGER.warning("Validation failed: Invalid date format for offset.")
+            errors[CONF_OFFSET] = offset_error
+
+    if errors:
+        _LOGGER.debug("Input validation failed: %s", errors)
+    return errors
 
 
 class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -83,30 +212,11 @@ class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
         return IstaOptionsFlowHandler()
 
     async def _validate_user_input(self, user_input: dict[str, Any]) -> dict[str, str]:
-        """Validate user input for credentials and settings."""
+        """Validate the credentials by logging in to the API."""
         errors: dict[str, str] = {}
         email = user_input[CONF_EMAIL]
         password = user_input[CONF_PASSWORD]
-        _LOGGER.debug("Starting input validation for user: %s", email)
-
-        if CONF_OFFSET in user_input:
-            try:
-                offset_date = date.fromisoformat(user_input[CONF_OFFSET])
-                min_date = get_min_offset_date()
-                if offset_date > min_date:
-                    _LOGGER.warning(
-                        "Validation failed: Offset date %s is more recent than minimum allowed %s.",
-                        offset_date,
-                        min_date,
-                    )
-                    errors[CONF_OFFSET] = "offset_too_recent"
-            except ValueError:
-                _LOGGER.warning("Validation failed: Invalid date format for offset.")
-                errors[CONF_OFFSET] = "invalid_date_format"
-
-        if errors:
-            _LOGGER.debug("Input validation failed: %s", errors)
-            return errors
+        _LOGGER.debug("Starting credential validation for user: %s", email)
 
         session = async_get_clientsession(self.hass)
         ista = PyCalistaIsta(email, password, session)
@@ -141,43 +251,28 @@ class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         if user_input is not None:
-            errors = await self._validate_user_input(user_input)
+            email = user_input[CONF_EMAIL]
+            # Abort for an already configured account before calling the API.
+            await self.async_set_unique_id(email.lower())
+            self._abort_if_unique_id_configured()
+
+            errors = _validate_local(user_input) or await self._validate_user_input(
+                user_input
+            )
             if not errors:
-                email = user_input[CONF_EMAIL]
                 _LOGGER.info(
                     "Validation successful. Creating config entry for %s", email
                 )
-                await self.async_set_unique_id(email.lower())
-                self._abort_if_unique_id_configured()
-
                 return self.async_create_entry(title=email, data=user_input)
 
+        today = dt_util.now().date()
         suggested_values = user_input or {}
         if CONF_OFFSET not in suggested_values:
-            suggested_values[CONF_OFFSET] = get_default_offset_date()
+            suggested_values[CONF_OFFSET] = _offset_defaults(today.toordinal())[0]
         _LOGGER.debug("Showing user form with suggested values: %s", suggested_values)
 
         schema = self.add_suggested_values_to_schema(
-            vol.Schema(
-                {
-                    vol.Required(CONF_EMAIL): TextSelector(
-                        TextSelectorConfig(
-                            type=TextSelectorType.EMAIL, autocomplete="email"
-                        )
-                    ),
-                    vol.Required(CONF_PASSWORD): TextSelector(
-                        TextSelectorConfig(
-                            type=TextSelectorType.PASSWORD,
-                            autocomplete="current-password",
-                        )
-                    ),
-                    vol.Required(CONF_OFFSET): DateSelector(DateSelectorConfig()),
-                    vol.Required(
-                        CONF_SEASON_START,
-                        default=f"{date.today().year}-{DEFAULT_SEASON_START_MONTH:02d}-{DEFAULT_SEASON_START_DAY:02d}",
-                    ): DateSelector(DateSelectorConfig()),
-                }
-            ),
+            _user_schema(_season_start_from({}, today.year)),
             suggested_values=suggested_values,
         )
 
@@ -200,18 +295,21 @@ class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         if user_input is not None:
-            errors = await self._validate_user_input(user_input)
+            new_email = user_input[CONF_EMAIL]
+            # Only check for a conflicting entry when the email (unique_id) changes.
+            if new_email.lower() != entry.unique_id:
+                await self.async_set_unique_id(new_email.lower())
+                self._abort_if_unique_id_configured()
+
+            errors = _validate_local(user_input) or await self._validate_user_input(
+                user_input
+            )
             if not errors:
-                new_email = user_input[CONF_EMAIL]
                 _LOGGER.info(
                     "Reconfiguration validated. Updating entry %s for account %s.",
                     entry.entry_id,
                     new_email,
                 )
-                # Only check for a conflicting entry when the email (unique_id) changes.
-                if new_email.lower() != entry.unique_id:
-                    await self.async_set_unique_id(new_email.lower())
-                    self._abort_if_unique_id_configured()
                 return self.async_update_reload_and_abort(
                     entry,
                     title=new_email,
@@ -219,12 +317,14 @@ class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
                     reason="reconfigure_successful",
                 )
 
+        today = dt_util.now().date()
         suggested_values = user_input or {
             CONF_EMAIL: entry.data[CONF_EMAIL],
-            CONF_OFFSET: entry.data.get(CONF_OFFSET, get_default_offset_date()),
+            CONF_OFFSET: entry.data.get(
+                CONF_OFFSET, _offset_defaults(today.toordinal())[0]
+            ),
             CONF_SEASON_START: entry.data.get(
-                CONF_SEASON_START,
-                f"{date.today().year}-{entry.data.get(CONF_SEASON_START_MONTH, DEFAULT_SEASON_START_MONTH):02d}-{entry.data.get(CONF_SEASON_START_DAY, DEFAULT_SEASON_START_DAY):02d}",
+                CONF_SEASON_START, _season_start_from(entry.data, today.year)
             ),
         }
         _LOGGER.debug(
@@ -232,24 +332,7 @@ class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
         )
 
         schema = self.add_suggested_values_to_schema(
-            vol.Schema(
-                {
-                    vol.Required(CONF_EMAIL): TextSelector(
-                        TextSelectorConfig(
-                            type=TextSelectorType.EMAIL, autocomplete="email"
-                        )
-                    ),
-                    vol.Required(CONF_PASSWORD): TextSelector(
-                        TextSelectorConfig(
-                            type=TextSelectorType.PASSWORD,
-                            autocomplete="current-password",
-                        )
-                    ),
-                    vol.Required(CONF_OFFSET): DateSelector(DateSelectorConfig()),
-                    vol.Required(CONF_SEASON_START): DateSelector(DateSelectorConfig()),
-                }
-            ),
-            suggested_values=suggested_values,
+            _RECONFIGURE_SCHEMA, suggested_values=suggested_values
         )
 
         return self.async_show_form(
@@ -296,16 +379,7 @@ class IstaConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_PASSWORD): TextSelector(
-                        TextSelectorConfig(
-                            type=TextSelectorType.PASSWORD,
-                            autocomplete="current-password",
-                        )
-                    ),
-                }
-            ),
+            data_schema=_REAUTH_SCHEMA,
             errors=errors,
             description_placeholders={CONF_EMAIL: email},
         )
@@ -330,44 +404,17 @@ class IstaOptionsFlowHandler(OptionsFlow):
             )
             return self.async_create_entry(title="", data=user_input)
 
-        schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL,
-                    default=self.config_entry.options.get(
-                        CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_HOURS
-                    ),
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=MIN_UPDATE_INTERVAL_HOURS,
-                        max=MAX_UPDATE_INTERVAL_HOURS,
-                        step=1,
-                        mode=NumberSelectorMode.SLIDER,
-                        unit_of_measurement="hours",
-                    )
-                ),
-                vol.Optional(
-                    CONF_LOG_LEVEL,
-                    default=self.config_entry.options.get(
-                        CONF_LOG_LEVEL, DEFAULT_LOG_LEVEL
-                    ),
-                ): SelectSelector(
-                    SelectSelectorConfig(
-                        options=LOG_LEVELS,
-                        mode=SelectSelectorMode.DROPDOWN,
-                    )
+        options = self.config_entry.options
+        data = self.config_entry.data
+        schema = _options_schema(
+            options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_HOURS),
+            options.get(CONF_LOG_LEVEL, DEFAULT_LOG_LEVEL),
+            options.get(
+                CONF_SEASON_START,
+                data.get(
+                    CONF_SEASON_START, _season_start_from(data, dt_util.now().year)
                 ),
-                vol.Optional(
-                    CONF_SEASON_START,
-                    default=self.config_entry.options.get(
-                        CONF_SEASON_START,
-                        self.config_entry.data.get(
-                            CONF_SEASON_START,
-                            f"{date.today().year}-{self.config_entry.data.get(CONF_SEASON_START_MONTH, DEFAULT_SEASON_START_MONTH):02d}-{self.config_entry.data.get(CONF_SEASON_START_DAY, DEFAULT_SEASON_START_DAY):02d}",
-                        ),
-                    ),
-                ): DateSelector(DateSelectorConfig()),
-            }
+            ),
         )
 
         return self.async_show_form(step_id="init", data_schema=schema)
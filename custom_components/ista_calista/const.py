@@ -9,7 +9,11 @@ DOMAIN: Final[str] = "ista_calista"
 MANUFACTURER: Final[str] = "ista"
 
 # --- Platforms ---
-PLATFORMS: Final[list[Platform]] = [Platform.SENSOR, Platform.BINARY_SENSOR, Platform.BUTTON]
+PLATFORMS: Final[tuple[Platform, ...]] = (
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+)
 
 # --- Events ---
 LTS_UPDATED_EVENT: Final[str] = "ista_calista_lts_updated"
@@ -31,6 +35,10 @@ DEFAULT_SEASON_START_DAY: Final[int] = 1
 MIN_UPDATE_INTERVAL_HOURS: Final[int] = 1
 MAX_UPDATE_INTERVAL_HOURS: Final[int] = 168
 
+# --- Storage ---
+HISTORY_STORAGE_VERSION: Final[int] = 1
+HISTORY_SAVE_DELAY: Final[int] = 60  # Seconds to debounce history cache writes
+
 # --- Other Constants ---
 LOG_LEVELS: Final[list[str]] = [
     "DEBUG",
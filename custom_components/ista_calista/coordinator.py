@@ -4,22 +4,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import date, timedelta
-from typing import TypedDict
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, TypedDict
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_EMAIL
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 from pycalista_ista import (
     BilledReading,
+    ColdWaterDevice,
     Device,
+    HeatingDevice,
+    HotWaterDevice,
     Invoice,
     IstaApiError,
     IstaConnectionError,
     IstaLoginError,
     PyCalistaIsta,
+    Reading,
 )
 
 from .const import (
@@ -27,10 +38,28 @@ from .const import (
     CONF_UPDATE_INTERVAL,
     DEFAULT_UPDATE_INTERVAL_HOURS,
     DOMAIN,
+    HISTORY_SAVE_DELAY,
+    HISTORY_STORAGE_VERSION,
+    MAX_UPDATE_INTERVAL_HOURS,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sort and bisect key for readings, shared with the sensor platform.
+reading_date = attrgetter("date")
+
+# Window re-fetched by polls made after the day's full resync has already run.
+_NARROW_FETCH_WINDOW = timedelta(days=2)
+
+# How far before the last successful fetch a full resync reaches back.
+_INCREMENTAL_FETCH_LOOKBACK = timedelta(days=30)
+
+# Device classes that can be restored from the history cache, keyed by class name.
+_DEVICE_TYPES: dict[str, type[Device]] = {
+    cls.__name__: cls
+    for cls in (Device, HeatingDevice, HotWaterDevice, ColdWaterDevice)
+}
+
 
 class IstaDeviceData(TypedDict):
     """TypedDict for Ista device data stored in the coordinator."""
@@ -40,6 +69,56 @@ class IstaDeviceData(TypedDict):
     invoices: list[Invoice]
 
 
+@lru_cache(maxsize=8)
+def _incremental_fetch_start(
+    today: date, last_fetch_date: date | None, init_date: date
+) -> date:
+    """Return the start of an incremental fetch window.
+
+    The window re-fetches 30 days before the last successful fetch to catch
+    delayed readings, but never reaches back past the configured offset date.
+    """
+    return max(init_date, (last_fetch_date or today) - _INCREMENTAL_FETCH_LOOKBACK)
+
+
+@lru_cache(maxsize=256)
+def slug_serial(serial_number: str) -> str:
+    """Return the serial number as used in statistic IDs (hyphens are not allowed)."""
+    return serial_number.replace("-", "_")
+
+
+def statistic_id(serial_number: str, key: str) -> str:
+    """Return the ID of the long-term statistic of a meter's sensor."""
+    return f"{DOMAIN}:{slug_serial(serial_number)}_{key}"
+
+
+def _merge_readings(history: list[Reading], readings: Iterable[Reading]) -> int:
+    """Merge readings into a date-sorted history in place.
+
+    Readings for a date already in the history replace the stored one. Returns
+    the number of readings for new dates.
+    """
+    new_readings = 0
+    for reading in readings:
+        # Fetched readings are mostly newer than anything stored: append them.
+        if not history or reading.date > history[-1].date:
+            history.append(reading)
+            new_readings += 1
+            continue
+        index = bisect_left(history, reading.date, key=reading_date)
+        if index < len(history) and history[index].date == reading.date:
+            history[index] = reading
+        else:
+            insort(history, reading, key=reading_date)
+            new_readings += 1
+    return new_readings
+
+
+def get_history_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the cached device history of a config entry."""
+    return Store(hass, HISTORY_STORAGE_VERSION, f"{DOMAIN}_history_{entry_id}")
+
+
 class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
     """Ista Calista data update coordinator."""
 
@@ -50,15 +129,46 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         ista: PyCalistaIsta,
+        init_date: date,
     ) -> None:
         """Initialize ista Calista data update coordinator."""
         self.ista: PyCalistaIsta = ista
         self.config_entry = config_entry
+        # Parsed and validated once at setup; never changes for the entry.
+        self._configured_init_date = init_date
+        # Statistic IDs of the LTS-generating sensors, by meter serial number.
+        self._lts_statistic_ids: dict[str, set[str]] = {}
+        # Statistic IDs of the meters present in the latest refresh result.
+        self.statistic_ids: set[str] = set()
+        # Most recent reading date across all devices, refreshed on each update.
+        self.latest_reading_date: datetime | None = None
+        # Login in flight, awaited by every caller that needs a session meanwhile.
+        self._login_task: asyncio.Task[Any] | None = None
+        # Device history persisted across restarts, so a cold start only needs
+        # to fetch the most recent readings instead of the full history.
+        self._history_store = get_history_store(hass, config_entry.entry_id)
+        # The configuration the cached history belongs to. Captured once, because
+        # reconfigure updates the entry data before this coordinator shuts down
+        # and writes its final snapshot.
+        self._history_email: str = config_entry.data[CONF_EMAIL]
+        self._history_offset: str = config_entry.data[CONF_OFFSET]
+        self._history_loaded = False
+        self._cached_devices: dict[str, Device] = {}
+        self._last_fetch_date: date | None = None
+        # Date of the last full (30-day window) fetch; later polls on the same
+        # day only re-fetch _NARROW_FETCH_WINDOW.
+        self._last_full_sync: date | None = None
 
         update_interval_hours = config_entry.options.get(
             CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL_HOURS
         )
         update_interval = timedelta(hours=update_interval_hours)
+        # Polling backs off from the configured interval while no new readings
+        # arrive (meters typically publish weekly or monthly).
+        self._base_update_interval = update_interval
+        self._max_update_interval = max(
+            update_interval, timedelta(hours=MAX_UPDATE_INTERVAL_HOURS)
+        )
 
         super().__init__(
             hass,
@@ -73,35 +183,202 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
             update_interval,
         )
 
+    async def async_shutdown(self) -> None:
+        """Cancel refreshes and flush the history cache to disk."""
+        await super().async_shutdown()
+        if self.data is not None:
+            await self._history_store.async_save(self._history_snapshot())
+
+    async def async_load_history(self) -> None:
+        """Load the device history cached by a previous run, if still valid."""
+        self._history_loaded = True
+        cached = await self._history_store.async_load()
+        if not cached:
+            return
+
+        if (
+            cached.get("email") != self._history_email
+            or cached.get("offset") != self._history_offset
+        ):
+            _LOGGER.debug("Discarding history cache created for another configuration.")
+            return
+
+        try:
+            devices: dict[str, Device] = {}
+            for serial, stored in cached["devices"].items():
+                device = _DEVICE_TYPES[stored["type"]](
+                    serial_number=serial, location=stored["location"]
+                )
+                device.history = [
+                    Reading(date=datetime.fromisoformat(reading_date), reading=value)
+                    for reading_date, value in stored["history"]
+                ]
+                devices[serial] = device
+            last_fetch_date = date.fromisoformat(cached["last_fetch"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring corrupt history cache: %s", err)
+            return
+
+        self._cached_devices = devices
+        self._last_fetch_date = last_fetch_date
+        _LOGGER.debug(
+            "Loaded cached history for %d device(s), last fetched on %s.",
+            len(devices),
+            last_fetch_date,
+        )
+
+    def _history_snapshot(self) -> dict[str, Any]:
+        """Serialize the current device history for the history cache."""
+        devices = self.data["devices"] if self.data else {}
+        return {
+            "email": self._history_email,
+            "offset": self._history_offset,
+            "last_fetch": (
+                self._last_fetch_date.isoformat() if self._last_fetch_date else None
+            ),
+            "devices": {
+                serial: {
+                    "type": type(device).__name__,
+                    "location": device.location,
+                    "history": [
+                        [reading.date.isoformat(), reading.reading]
+                        for reading in device.history
+                    ],
+                }
+                for serial, device in devices.items()
+            },
+        }
+
+    def register_statistic_id(self, serial_number: str, statistic_id: str) -> None:
+        """Register the statistic ID of an LTS-generating sensor for a meter."""
+        self._lts_statistic_ids.setdefault(serial_number, set()).add(statistic_id)
+        self.statistic_ids.add(statistic_id)
+
+    def _set_statistic_ids(self, devices: dict[str, Device]) -> None:
+        """Rebuild the statistic IDs from the meters of a refresh result."""
+        self.statistic_ids = {
+            statistic_id
+            for serial in devices
+            for statistic_id in self._lts_statistic_ids.get(serial, ())
+        }
+
+    def _set_latest_reading_date(self, devices: dict[str, Device]) -> None:
+        """Record the most recent reading date across all devices."""
+        # Histories are sorted by date, so only the last reading of each matters.
+        self.latest_reading_date = max(
+            (device.history[-1].date for device in devices.values() if device.history),
+            default=None,
+        )
+
+    def _adapt_update_interval(self, new_readings: int) -> None:
+        """Double the polling interval on idle updates, reset it on new readings."""
+        if new_readings:
+            update_interval = self._base_update_interval
+        else:
+            current = self.update_interval or self._base_update_interval
+            update_interval = min(current * 2, self._max_update_interval)
+        if update_interval != self.update_interval:
+            _LOGGER.debug("Adjusting update interval to %s.", update_interval)
+            self.update_interval = update_interval
+
+    async def async_login(self) -> None:
+        """Log in, sharing a single in-flight login between concurrent callers.
+
+        Callers that arrive while a login is running await that same attempt,
+        so they also see its failure.
+        """
+        if self._login_task is None:
+            self._login_task = self.hass.async_create_task(
+                self.ista.login(),
+                f"{DOMAIN} login {self.config_entry.entry_id}",
+                eager_start=False,
+            )
+            self._login_task.add_done_callback(self._async_login_finished)
+        # Shielded, so one cancelled caller does not abort the login for the others.
+        await asyncio.shield(self._login_task)
+
+    @callback
+    def _async_login_finished(self, task: asyncio.Task[Any]) -> None:
+        """Let the next caller start a new login once this one is done."""
+        if self._login_task is task:
+            self._login_task = None
+
+    async def _async_fetch_all(self, start: date, end: date) -> list[Any]:
+        """Fetch device history, billed consumption and invoices concurrently.
+
+        Failures are returned in place of the results, to be classified by the
+        caller.
+        """
+        return await asyncio.gather(
+            self.ista.get_devices_history(start=start, end=end),
+            self.ista.get_billed_consumption(),
+            self.ista.get_invoices(),
+            self.ista.get_invoice_xls(),
+            return_exceptions=True,
+        )
+
+    async def _async_relogin_and_fetch(self, start: date, end: date) -> list[Any]:
+        """Log in again and retry all fetches once."""
+        _LOGGER.debug("Session rejected by the API; logging in again.")
+        try:
+            await self.async_login()
+        except Exception as err:  # noqa: BLE001 - classified by the caller
+            # Only the device history result decides the outcome of the update.
+            return [err, [], [], []]
+        # Every call shared the rejected session, so none of the results is usable.
+        return await self._async_fetch_all(start, end)
+
     async def _async_update_data(self) -> IstaDeviceData:
         """Fetch latest data and merge with existing history."""
         _LOGGER.debug("Starting data update for account: %s", self.config_entry.title)
-        is_initial_fetch = not self.data or not self.data.get("devices")
+        if not self._history_loaded:
+            await self.async_load_history()
+
+        today = dt_util.now().date()
+        # The first refresh after setup may only re-fetch readings already in
+        # the history cache; that says nothing about the meters being idle.
+        first_refresh = self.data is None
+        current_devices = self.data["devices"] if self.data else self._cached_devices
+        is_initial_fetch = not current_devices
+        full_sync = is_initial_fetch or self._last_full_sync != today
 
         if is_initial_fetch:
-            offset_date_str = self.config_entry.data[CONF_OFFSET]
-            fetch_start_date = date.fromisoformat(offset_date_str)
+            fetch_start_date = self._configured_init_date
             _LOGGER.debug(
                 "Performing initial historical data fetch from %s.",
-                fetch_start_date.isoformat(),
+                fetch_start_date,
+            )
+        elif full_sync:
+            # Anchoring on the last successful fetch (restored from the history
+            # cache after a restart) also covers any outage since then.
+            fetch_start_date = _incremental_fetch_start(
+                today, self._last_fetch_date, self._configured_init_date
             )
-        else:
-            # Fetch last 30 days to catch any delayed readings
-            fetch_start_date = dt_util.now().date() - timedelta(days=30)
             _LOGGER.debug(
                 "Performing incremental data fetch from %s.",
-                fetch_start_date.isoformat(),
+                fetch_start_date,
+            )
+        else:
+            # Readings are published at most daily and today's full resync has
+            # already run, so only the most recent days can have changed.
+            fetch_start_date = max(
+                self._configured_init_date, today - _NARROW_FETCH_WINDOW
+            )
+            _LOGGER.debug(
+                "Performing narrow data fetch from %s.",
+                fetch_start_date,
             )
 
-        fetch_end_date = dt_util.now().date()
+        fetch_end_date = today
 
-        devices_result, billed_result, invoice_result, invoice_xls_result = await asyncio.gather(
-            self.ista.get_devices_history(start=fetch_start_date, end=fetch_end_date),
-            self.ista.get_billed_consumption(),
-            self.ista.get_invoices(),
-            self.ista.get_invoice_xls(),
-            return_exceptions=True,
-        )
+        results = await self._async_fetch_all(fetch_start_date, fetch_end_date)
+        if isinstance(results[0], IstaLoginError):
+            # The session may simply have expired; log in once more before
+            # asking the user to re-authenticate.
+            results = await self._async_relogin_and_fetch(
+                fetch_start_date, fetch_end_date
+            )
+        devices_result, billed_result, invoice_result, invoice_xls_result = results
 
         # Device history failure is fatal
         if isinstance(devices_result, IstaLoginError):
@@ -121,11 +398,16 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
             ) from devices_result
 
         new_devices_history: dict[str, Device] = devices_result
+        self._last_fetch_date = fetch_end_date
+        if full_sync:
+            self._last_full_sync = today
+        self._cached_devices = {}
+        self._history_store.async_delay_save(self._history_snapshot, HISTORY_SAVE_DELAY)
         _LOGGER.debug(
             "Fetched data from API for %d device(s) for period %s to %s.",
             len(new_devices_history),
-            fetch_start_date.isoformat(),
-            fetch_end_date.isoformat(),
+            fetch_start_date,
+            fetch_end_date,
         )
 
         # Non-fatal billing failures
@@ -164,7 +446,6 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
             key = _get_inv_key(inv)
             if key in merged_invoices:
                 existing = merged_invoices[key]
-                from dataclasses import replace
                 merged_invoices[key] = replace(existing, invoice_id=inv.invoice_id)
             else:
                 # If exact match fails, try matching by (date, type, amount) if invoice_number is None
@@ -184,17 +465,26 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
 
         invoices = list(merged_invoices.values())
 
+        # Histories are kept sorted by date so later merges can bisect into them.
+        for serial, device in new_devices_history.items():
+            if serial not in current_devices:
+                device.history.sort(key=reading_date)
+
         if is_initial_fetch:
             if not new_devices_history:
                 _LOGGER.warning(
                     "No devices found in Ista Calista account during initial fetch. "
                     "This may be normal if the account is new."
                 )
+                self.latest_reading_date = None
+                self.statistic_ids = set()
                 return {"devices": {}, "billed_readings": billed_readings, "invoices": invoices}
             _LOGGER.info(
                 "Initial fetch successful. Discovered %d device(s).",
                 len(new_devices_history),
             )
+            self._set_latest_reading_date(new_devices_history)
+            self._set_statistic_ids(new_devices_history)
             return {
                 "devices": new_devices_history,
                 "billed_readings": billed_readings,
@@ -204,38 +494,34 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
         # This is an incremental update. We must handle devices that are removed from the API.
         # We will build a new state dictionary based on the latest API response.
         _LOGGER.debug("Merging new data with existing coordinator data.")
-        current_devices = self.data["devices"]
         updated_devices: dict[str, Device] = {}
         total_new_readings = 0
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
         # The new API response is the source of truth for which devices exist.
+        get_current_device = current_devices.get
         for serial, device_from_api in new_devices_history.items():
-            if serial in current_devices:
+            if (existing_device := get_current_device(serial)) is not None:
                 # The device persists. Merge its history to preserve older data.
-                existing_device = current_devices[serial]
 
-                # Use a dictionary keyed by date to efficiently merge and deduplicate readings.
-                history_by_date = {
-                    reading.date: reading for reading in existing_device.history
-                }
-                new_readings_count = 0
-                for new_reading in device_from_api.history:
-                    if new_reading.date not in history_by_date:
-                        new_readings_count += 1
-                    history_by_date[new_reading.date] = new_reading
+                # The stored history is already sorted: only the fetched window
+                # is bisected into it instead of re-sorting the whole history.
+                history = existing_device.history
+                new_readings_count = _merge_readings(history, device_from_api.history)
 
                 if new_readings_count > 0:
-                    _LOGGER.debug(
-                        "Found %d new reading(s) for device %s.",
-                        new_readings_count,
-                        serial,
-                    )
+                    if debug_enabled:
+                        _LOGGER.debug(
+                            "Found %d new reading(s) for device %s.",
+                            new_readings_count,
+                            serial,
+                        )
                     total_new_readings += new_readings_count
 
                 # Update the device object with the fully merged and sorted history.
-                device_from_api.history = sorted(
-                    history_by_date.values(), key=lambda r: r.date
-                )
+                # The previous Device object keeps sharing this list; consumers
+                # must resolve devices from the latest coordinator data.
+                device_from_api.history = history
             else:
                 # This is a newly discovered device.
                 _LOGGER.info("Discovered new device during update: %s", serial)
@@ -243,6 +529,12 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
 
             updated_devices[serial] = device_from_api
 
+        if not full_sync:
+            # A narrow window may omit devices without recent readings; only a
+            # full resync is authoritative about which devices still exist.
+            for serial, device in current_devices.items():
+                updated_devices.setdefault(serial, device)
+
         removed_count = len(current_devices) - len(updated_devices)
         if removed_count > 0:
             _LOGGER.info(
@@ -255,8 +547,12 @@ class IstaCoordinator(DataUpdateCoordinator[IstaDeviceData]):
             total_new_readings,
             len(updated_devices),
         )
-        # By returning the newly constructed dictionary, we implicitly drop any
-        # devices that were not in the latest API response.
+        if not first_refresh:
+            self._adapt_update_interval(total_new_readings)
+        self._set_latest_reading_date(updated_devices)
+        self._set_statistic_ids(updated_devices)
+        # By returning the newly constructed dictionary, a full resync implicitly
+        # drops any devices that were not in the latest API response.
         return {
             "devices": updated_devices,
             "billed_readings": billed_readings,
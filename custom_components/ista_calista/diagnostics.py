@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Final
 
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.core import HomeAssistant
@@ -14,6 +15,15 @@ from . import IstaConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on the per-device entries included in a diagnostics download.
+MAX_DIAGNOSTICS_DEVICES: Final[int] = 1000
+
+
+@lru_cache(maxsize=512)
+def _short_serial_hash(serial: str) -> str:
+    """Return a short, stable digest identifying a serial number without exposing it."""
+    return hashlib.sha256(serial.encode()).hexdigest()[:8]
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: IstaConfigEntry
@@ -26,15 +36,13 @@ async def async_get_config_entry_diagnostics(
     redacted_data[CONF_PASSWORD] = "**REDACTED**"
 
     last_update_iso = None
-    if coordinator.last_update_success and coordinator.data:
-        # Find the most recent reading across all devices to serve as the last update time.
-        all_readings: list[datetime] = [
-            reading.date
-            for device in coordinator.data.get("devices", {}).values()
-            for reading in device.history
-        ]
-        if all_readings:
-            last_update_iso = max(all_readings).isoformat()
+    if (
+        coordinator.last_update_success
+        and coordinator.data
+        and coordinator.latest_reading_date
+    ):
+        # The most recent reading across all devices serves as the last update time.
+        last_update_iso = coordinator.latest_reading_date.isoformat()
 
     diag_data = {
         "config_entry": {
@@ -54,30 +62,30 @@ async def async_get_config_entry_diagnostics(
                 if coordinator.update_interval
                 else None
             ),
+            "statistic_ids": sorted(coordinator.statistic_ids),
         },
         "api_data_summary": {},
     }
 
-    if coordinator.data and coordinator.data.get("devices"):
-        devices_summary: list[dict[str, Any]] = []
-        for serial, device in coordinator.data["devices"].items():
-            hashed_serial = hashlib.sha256(serial.encode()).hexdigest()[:8]
-            devices_summary.append(
-                {
-                    "serial_hash": hashed_serial,
-                    "type": device.__class__.__name__,
-                    "location": device.location,
-                    "history_count": len(device.history),
-                    "last_reading_date": (
-                        device.last_reading.date.isoformat()
-                        if device.last_reading
-                        else None
-                    ),
-                }
-            )
+    devices = coordinator.data.get("devices") if coordinator.data else None
+    if devices:
+        device_summaries = (
+            {
+                "serial_hash": _short_serial_hash(serial),
+                "type": device.__class__.__name__,
+                "location": device.location,
+                "history_count": len(device.history),
+                "last_reading_date": (
+                    last_reading.date.isoformat()
+                    if (last_reading := device.last_reading)
+                    else None
+                ),
+            }
+            for serial, device in devices.items()
+        )
         diag_data["api_data_summary"] = {
-            "device_count": len(devices_summary),
-            "devices": devices_summary,
+            "device_count": len(devices),
+            "devices": list(islice(device_summaries, MAX_DIAGNOSTICS_DEVICES)),
         }
     else:
         _LOGGER.debug("No coordinator data available for diagnostics.")
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, Final
+from functools import lru_cache
+from itertools import batched
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components.recorder import get_instance  # type: ignore[attr-defined]
 from homeassistant.components.recorder.models import (
@@ -27,7 +30,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import CONF_EMAIL, EntityCategory, UnitOfEnergy, UnitOfVolume
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
@@ -45,6 +48,7 @@ from .const import (
     LTS_UPDATED_EVENT,
     MANUFACTURER,
 )
+from .coordinator import reading_date, statistic_id
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -55,11 +59,18 @@ _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+# Large backfills are handed to the recorder in chunks of this many rows.
+IMPORT_STATISTICS_BATCH_SIZE: Final[int] = 1000
+
+# Window used by the average daily consumption sensor.
+_AVERAGE_WINDOW = timedelta(days=30)
+
 
 @dataclass(frozen=True, kw_only=True)
 class CalistaSensorEntityDescription(SensorEntityDescription):
     """Describes an Ista Calista sensor entity."""
 
+    device_type: type[Device] | None = None
     exists_fn: Callable[[Device], bool] = lambda _: True
     value_fn: Callable[[Device], StateType]
     generate_lts: bool = False
@@ -87,6 +98,25 @@ class CalistaInvoiceSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[list[Invoice], str], StateType]
 
 
+def _last_reading_value(device: Device) -> StateType:
+    """Return the value of the latest reading of a meter, if any."""
+    last_reading = device.last_reading
+    return last_reading.reading if last_reading is not None else None
+
+
+def _has_last_reading(device: Device) -> bool:
+    """Return True if the meter has at least one reading."""
+    return bool(device.last_reading)
+
+
+def _latest_invoice_amount(invoices: list[Invoice], device_type: str) -> StateType:
+    """Return the amount of the latest invoice for a service type, if any."""
+    return next(
+        (invoice.amount for invoice in invoices if invoice.device_type == device_type),
+        None,
+    )
+
+
 SENSOR_DESCRIPTIONS: Final[tuple[CalistaSensorEntityDescription, ...]] = (
     CalistaSensorEntityDescription(
         key="water",
@@ -95,10 +125,8 @@ SENSOR_DESCRIPTIONS: Final[tuple[CalistaSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=3,
-        value_fn=lambda device: (
-            device.last_reading.reading if device.last_reading else None
-        ),
-        exists_fn=lambda device: isinstance(device, ColdWaterDevice),
+        value_fn=_last_reading_value,
+        device_type=ColdWaterDevice,
         generate_lts=True,
     ),
     CalistaSensorEntityDescription(
@@ -108,10 +136,8 @@ SENSOR_DESCRIPTIONS: Final[tuple[CalistaSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=3,
-        value_fn=lambda device: (
-            device.last_reading.reading if device.last_reading else None
-        ),
-        exists_fn=lambda device: isinstance(device, HotWaterDevice),
+        value_fn=_last_reading_value,
+        device_type=HotWaterDevice,
         generate_lts=True,
     ),
     CalistaSensorEntityDescription(
@@ -121,10 +147,8 @@ SENSOR_DESCRIPTIONS: Final[tuple[CalistaSensorEntityDescription, ...]] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         suggested_display_precision=2,
-        value_fn=lambda device: (
-            device.last_reading.reading if device.last_reading else None
-        ),
-        exists_fn=lambda device: isinstance(device, HeatingDevice),
+        value_fn=_last_reading_value,
+        device_type=HeatingDevice,
         generate_lts=True,
     ),
     CalistaSensorEntityDescription(
@@ -134,12 +158,26 @@ SENSOR_DESCRIPTIONS: Final[tuple[CalistaSensorEntityDescription, ...]] = (
         value_fn=lambda device: (
             dt_util.as_utc(device.last_reading.date) if device.last_reading else None
         ),
-        exists_fn=lambda device: bool(device.last_reading),
+        exists_fn=_has_last_reading,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
     ),
 )
 
+
+@lru_cache(maxsize=8)
+def _descriptions_for(
+    device_type: type[Device],
+) -> tuple[CalistaSensorEntityDescription, ...]:
+    """Return the sensor descriptions that apply to a meter type."""
+    return tuple(
+        description
+        for description in SENSOR_DESCRIPTIONS
+        if description.device_type is None
+        or issubclass(device_type, description.device_type)
+    )
+
+
 BILLED_SENSOR_DESCRIPTIONS: Final[tuple[CalistaBilledSensorEntityDescription, ...]] = (
     CalistaBilledSensorEntityDescription(
         key="billed_reading",
@@ -170,14 +208,26 @@ ACCOUNT_SENSOR_DESCRIPTIONS: Final[tuple[CalistaAccountSensorEntityDescription,
 )
 
 
+_UNIT_CLASSES: Final[dict[str | None, str]] = {
+    UnitOfEnergy.KILO_WATT_HOUR: "energy",
+    UnitOfVolume.CUBIC_METERS: "volume",
+}
+
+_MODEL_MAP: Final[dict[type[Device], str]] = {
+    ColdWaterDevice: "Cold Water Meter",
+    HotWaterDevice: "Hot Water Meter",
+    HeatingDevice: "Heating Meter",
+}
+
+
+def _device_name(device: Device, serial_number: str) -> str:
+    """Return the display name of a meter device."""
+    return device.location or f"Ista Meter {serial_number[-4:]}"
+
+
 def _make_device_info(device: Device, serial_number: str) -> DeviceInfo:
     """Create a DeviceInfo object for a meter device."""
-    model_map: dict[type[Device], str] = {
-        ColdWaterDevice: "Cold Water Meter",
-        HotWaterDevice: "Hot Water Meter",
-        HeatingDevice: "Heating Meter",
-    }
-    model = model_map.get(type(device))
+    model = _MODEL_MAP.get(type(device))
     if model is None:
         _LOGGER.warning(
             "Unknown device type '%s' for serial %s; falling back to 'Generic Meter'.",
@@ -185,15 +235,9 @@ def _make_device_info(device: Device, serial_number: str) -> DeviceInfo:
             serial_number,
         )
         model = "Generic Meter"
-    device_name = (
-        device.location
-        if device.location
-        else f"Ista Meter {serial_number[-4:]}"
-    )
-
     return DeviceInfo(
         identifiers={(DOMAIN, serial_number)},
-        name=device_name,
+        name=_device_name(device, serial_number),
         manufacturer=MANUFACTURER,
         model=model,
         configuration_url="https://oficina.ista.es/GesCon/MainPageAbo.do",
@@ -238,11 +282,13 @@ class IstaAverageDailySensor(CoordinatorEntity["IstaCoordinator"], SensorEntity)
         if not device or not device.history or len(device.history) < 2:
             return None
 
-        now = dt_util.now()
-        thirty_days_ago = now - timedelta(days=30)
-
-        # Get readings within the last 30 days, skipping None values
-        recent_readings = [r for r in device.history if r.date >= thirty_days_ago and r.reading is not None]
+        # Get readings within the last 30 days, skipping None values. The
+        # history is sorted, so the window start is found by bisection.
+        history = device.history
+        window_start = bisect_left(
+            history, dt_util.now() - _AVERAGE_WINDOW, key=reading_date
+        )
+        recent_readings = [r for r in history[window_start:] if r.reading is not None]
 
         if not recent_readings or len(recent_readings) < 2:
             # Fallback to last 2 valid readings if we don't have enough in 30 days
@@ -367,10 +413,13 @@ async def async_setup_entry(
     coordinator: IstaCoordinator = config_entry.runtime_data
     _LOGGER.debug("Setting up sensor platform for entry: %s", config_entry.entry_id)
 
-    tracked_entity_ids: set[str] = set()
+    # Meter entities are tracked by (serial, key) to avoid building unique IDs
+    # for every meter on each coordinator update.
+    tracked_entity_ids: set[tuple[str, str]] = set()
     billed_tracked: set[str] = set()
     invoice_tracked: set[str] = set()
     account_sensors_added = False
+    importer = IstaStatisticsImporter(hass, config_entry)
 
     @callback
     def _add_entities_callback() -> None:
@@ -388,34 +437,36 @@ async def async_setup_entry(
             _LOGGER.debug("No devices in coordinator data. Skipping entity setup.")
         else:
             for serial, device in coordinator.data["devices"].items():
-                for description in SENSOR_DESCRIPTIONS:
-                    unique_id = f"{serial}_{description.key}"
-                    if unique_id not in tracked_entity_ids and description.exists_fn(device):
+                for description in _descriptions_for(type(device)):
+                    entity_key = (serial, description.key)
+                    if entity_key not in tracked_entity_ids and description.exists_fn(device):
                         _LOGGER.debug(
-                            "Found new entity to add: Unique ID=%s, Device SN=%s, Key=%s",
-                            unique_id,
+                            "Found new entity to add: Device SN=%s, Key=%s",
                             serial,
                             description.key,
                         )
-                        new_entities.append(IstaSensor(coordinator, serial, description))
-                        tracked_entity_ids.add(unique_id)
+                        new_entities.append(
+                            IstaSensor(coordinator, serial, description, importer)
+                        )
+                        tracked_entity_ids.add(entity_key)
 
                         if description.generate_lts:
-                            lts_uid = f"{serial}_{description.key}_lts_last_import"
-                            if lts_uid not in tracked_entity_ids:
+                            lts_key = (serial, f"{description.key}_lts_last_import")
+                            if lts_key not in tracked_entity_ids:
                                 new_entities.append(
                                     IstaLtsLastImportSensor(serial, description.key, device)
                                 )
-                                tracked_entity_ids.add(lts_uid)
+                                tracked_entity_ids.add(lts_key)
 
                 # Average daily consumption sensor
-                avg_unique_id = f"{serial}_average_daily_consumption"
-                if avg_unique_id not in tracked_entity_ids:
+                avg_key = (serial, "average_daily_consumption")
+                if avg_key not in tracked_entity_ids:
                     new_entities.append(IstaAverageDailySensor(coordinator, serial, device))
-                    tracked_entity_ids.add(avg_unique_id)
+                    tracked_entity_ids.add(avg_key)
 
                 # Seasonal consumption sensor (single entity)
-                if device.history:
+                seasonal_key = (serial, "seasonal_consumption")
+                if device.history and seasonal_key not in tracked_entity_ids:
                     # Determine current season start Month/Day
                     season_start_str = config_entry.options.get(
                         CONF_SEASON_START,
@@ -451,18 +502,16 @@ async def async_setup_entry(
                             )
                         )
 
-                    s_unique_id = f"{serial}_seasonal_consumption"
-                    if s_unique_id not in tracked_entity_ids:
-                        new_entities.append(
-                            IstaSeasonalConsumptionSensor(
-                                coordinator,
-                                serial,
-                                device,
-                                start_month,
-                                start_day,
-                            )
+                    new_entities.append(
+                        IstaSeasonalConsumptionSensor(
+                            coordinator,
+                            serial,
+                            device,
+                            start_month,
+                            start_day,
                         )
-                        tracked_entity_ids.add(s_unique_id)
+                    )
+                    tracked_entity_ids.add(seasonal_key)
 
             if not account_sensors_added:
                 for description in ACCOUNT_SENSOR_DESCRIPTIONS:
@@ -485,9 +534,7 @@ async def async_setup_entry(
                     device_class=SensorDeviceClass.MONETARY,
                     state_class=SensorStateClass.TOTAL,
                     device_type=d_type,
-                    value_fn=lambda invs, dt: next(
-                        (i.amount for i in invs if i.device_type == dt), None
-                    ),
+                    value_fn=_latest_invoice_amount,
                 )
                 new_entities.append(
                     IstaInvoiceSensor(coordinator, config_entry, description)
@@ -555,10 +602,133 @@ async def async_setup_entry(
             _LOGGER.debug("No new entities to add.")
 
     config_entry.async_on_unload(coordinator.async_add_listener(_add_entities_callback))
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(importer.async_schedule_import)
+    )
     _LOGGER.debug("Initial entity check for entry %s.", config_entry.entry_id)
     _add_entities_callback()
 
 
+def _get_last_statistics_batch(
+    hass: HomeAssistant, statistic_ids: list[str]
+) -> dict[str, list[Any]]:
+    """Fetch the latest statistic of every ID within a single executor job."""
+    last_stats: dict[str, list[Any]] = {}
+    for statistic_id in statistic_ids:
+        last_stats.update(
+            get_last_statistics(
+                hass, 1, statistic_id, True, {"end", "state", "sum", "last_reset"}
+            )
+        )
+    return last_stats
+
+
+class IstaStatisticsImporter:
+    """Import long-term statistics for all LTS sensors of a config entry at once.
+
+    Imports requested while one is pending are coalesced, so a coordinator
+    update costs a single recorder executor job regardless of the number of
+    sensors.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the importer."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._sensors: dict[str, IstaSensor] = {}
+        self._pending: set[str] = set()
+        self._lock = asyncio.Lock()
+
+    @callback
+    def async_register(self, sensor: IstaSensor) -> CALLBACK_TYPE:
+        """Register a sensor and schedule its initial import."""
+        statistic_id = sensor.statistic_id
+        self._sensors[statistic_id] = sensor
+        self.async_schedule_import([statistic_id])
+
+        @callback
+        def _unregister() -> None:
+            self._sensors.pop(statistic_id, None)
+
+        return _unregister
+
+    @callback
+    def async_schedule_import(self, statistic_ids: list[str] | None = None) -> None:
+        """Schedule an import for the given, or all registered, sensors."""
+        schedule = not self._pending
+        self._pending.update(self._sensors if statistic_ids is None else statistic_ids)
+        if schedule and self._pending:
+            # Tracked by the config entry, so unloading waits for a running
+            # import instead of leaving it to touch torn-down coordinator data.
+            # Not started eagerly: sensors added in the same batch register
+            # before the task drains the pending set.
+            self._config_entry.async_create_task(
+                self._hass,
+                self._async_import_pending(),
+                f"{DOMAIN} statistics import {self._config_entry.entry_id}",
+                eager_start=False,
+            )
+
+    async def _async_import_pending(self) -> None:
+        """Import statistics for every sensor with a pending request."""
+        async with self._lock:
+            pending, self._pending = self._pending, set()
+            sensors = [
+                sensor
+                for statistic_id in pending
+                if (sensor := self._sensors.get(statistic_id)) is not None
+            ]
+            stale: list[IstaSensor] = []
+            for sensor in sensors:
+                if sensor.statistics_current:
+                    # Nothing changed since the last import: skip the recorder
+                    # lookup but still report the statistics as current.
+                    _LOGGER.debug(
+                        "Statistics for %s are up to date.", sensor.statistic_id
+                    )
+                    sensor.async_fire_lts_updated()
+                else:
+                    stale.append(sensor)
+            if not stale:
+                return
+            sensors = stale
+            recorder = get_instance(self._hass)
+            if recorder is None:
+                _LOGGER.warning(
+                    "Recorder not available; skipping statistics import for %d sensor(s).",
+                    len(sensors),
+                )
+                return
+            _LOGGER.debug("Importing statistics for %d sensor(s).", len(sensors))
+            last_stats: dict[str, list[Any]] | None
+            try:
+                last_stats = await recorder.async_add_executor_job(
+                    _get_last_statistics_batch,
+                    self._hass,
+                    [sensor.statistic_id for sensor in sensors],
+                )
+            except Exception:
+                _LOGGER.exception(
+                    "Batched statistics lookup failed; looking up each sensor separately."
+                )
+                last_stats = None
+            # A failing sensor must not hold back the imports of the others.
+            for sensor in sensors:
+                try:
+                    sensor_stats = last_stats
+                    if sensor_stats is None:
+                        sensor_stats = await recorder.async_add_executor_job(
+                            _get_last_statistics_batch,
+                            self._hass,
+                            [sensor.statistic_id],
+                        )
+                    await sensor.async_import_statistics(sensor_stats)
+                except Exception:
+                    _LOGGER.exception(
+                        "Failed to import statistics for %s.", sensor.statistic_id
+                    )
+
+
 class IstaSensor(CoordinatorEntity["IstaCoordinator"], SensorEntity):
     """Representation of an Ista Calista sensor."""
 
@@ -570,23 +740,44 @@ class IstaSensor(CoordinatorEntity["IstaCoordinator"], SensorEntity):
         coordinator: IstaCoordinator,
         serial_number: str,
         entity_description: CalistaSensorEntityDescription,
+        importer: IstaStatisticsImporter,
     ) -> None:
         """Initialize the Ista Calista sensor."""
         super().__init__(coordinator)
+        self._importer = importer
         self._serial_number = serial_number
         self.entity_description = entity_description
         self._attr_unique_id = f"{serial_number}_{entity_description.key}"
         self._attr_translation_key = entity_description.translation_key
-        self._stats_import_lock = asyncio.Lock()
+        self._statistic_id = statistic_id(serial_number, entity_description.key)
+        if entity_description.generate_lts:
+            coordinator.register_statistic_id(serial_number, self._statistic_id)
+        self._fallback_name = (
+            (entity_description.translation_key or entity_description.key)
+            .replace("_", " ")
+            .title()
+        )
+        # Date of the latest reading known to be covered by the statistics.
+        self._statistics_through: datetime | None = None
+        self._unit_class = _UNIT_CLASSES.get(
+            entity_description.native_unit_of_measurement
+        )
 
-        self._attr_device_info = _make_device_info(coordinator.data["devices"][serial_number], serial_number)
+        device = coordinator.data["devices"][serial_number]
+        # Refreshed on each coordinator update, so state reads skip the lookup.
+        self._device_data: Device | None = device
+        self._attr_device_info = _make_device_info(device, serial_number)
+        self._device_info_key: tuple[type[Device], str | None] = (
+            type(device),
+            device.location,
+        )
         _LOGGER.debug("IstaSensor initialized: %s", self.unique_id)
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra state attributes."""
         attrs = {}
-        device = self.coordinator.data["devices"].get(self._serial_number)
+        device = self._device_data
         if device and device.last_reading:
             attrs["last_reading_date"] = dt_util.as_utc(device.last_reading.date).isoformat()
         return attrs
@@ -595,29 +786,44 @@ class IstaSensor(CoordinatorEntity["IstaCoordinator"], SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         _LOGGER.debug("Coordinator update for entity: %s", self.unique_id)
-        if device := self._device_data:
-            self._attr_device_info = _make_device_info(device, self._serial_number)
-            if self.entity_description.generate_lts:
-                _LOGGER.debug(
-                    "LTS generation is enabled, creating statistics import task for %s",
-                    self.unique_id,
-                )
-                self.hass.async_create_task(self.async_import_statistics())
+        self._device_data = device = self._lookup_device()
+        if device is not None:
+            # Only rebuild the device info when the meter type or location changes.
+            device_info_key = (type(device), device.location)
+            if device_info_key != self._device_info_key:
+                self._device_info_key = device_info_key
+                self._attr_device_info = _make_device_info(device, self._serial_number)
         super()._handle_coordinator_update()
 
     async def async_added_to_hass(self) -> None:
         """Handle entity addition."""
         await super().async_added_to_hass()
         _LOGGER.debug("Entity %s added to hass.", self.unique_id)
+        # Catch up on any update that arrived before the listener was attached.
+        self._device_data = self._lookup_device()
         if self.entity_description.generate_lts:
             _LOGGER.debug(
-                "LTS generation is enabled, creating initial statistics import task for %s",
+                "LTS generation is enabled, registering %s for statistics import",
                 self.unique_id,
             )
-            self.hass.async_create_task(self.async_import_statistics())
+            self.async_on_remove(self._importer.async_register(self))
+
+    @property
+    def statistic_id(self) -> str:
+        """Return the ID of the long-term statistic fed by this sensor."""
+        return self._statistic_id
 
     @property
-    def _device_data(self) -> Device | None:
+    def statistics_current(self) -> bool:
+        """Return True if the imported statistics cover the latest reading."""
+        device = self._lookup_device()
+        return (
+            device is not None
+            and bool(device.history)
+            and device.history[-1].date == self._statistics_through
+        )
+
+    def _lookup_device(self) -> Device | None:
         """Safely get the device data from the coordinator."""
         if self.coordinator.data and "devices" in self.coordinator.data:
             return self.coordinator.data["devices"].get(self._serial_number)
@@ -638,9 +844,15 @@ class IstaSensor(CoordinatorEntity["IstaCoordinator"], SensorEntity):
             _LOGGER.debug("Sensor %s is unavailable.", self.unique_id)
         return is_available
 
-    async def async_import_statistics(self) -> None:
-        """Import historical data as long-term statistics."""
-        device = self._device_data
+    async def async_import_statistics(self, last_stats: dict[str, list[Any]]) -> None:
+        """Import historical data as long-term statistics.
+
+        `last_stats` maps statistic IDs to the latest stored statistic, as
+        returned by `get_last_statistics`.
+        """
+        # Read from the coordinator rather than _device_data: the importer can
+        # run before this entity has handled the update that scheduled it.
+        device = self._lookup_device()
         if not device or not device.history:
             _LOGGER.debug(
                 "Skipping statistics import for %s: no device data or history available.",
@@ -648,192 +860,159 @@ class IstaSensor(CoordinatorEntity["IstaCoordinator"], SensorEntity):
             )
             return
 
-        assert self.unique_id is not None
-        statistic_id = f"{DOMAIN}:{self.unique_id.replace('-', '_')}"
+        statistic_id = self._statistic_id
         _LOGGER.debug("Starting statistics import for statistic_id: %s", statistic_id)
 
-        async with self._stats_import_lock:
-            _LOGGER.debug("Acquired statistics import lock for %s", statistic_id)
-            recorder = get_instance(self.hass)
-            if recorder is None:
-                _LOGGER.warning(
-                    "Recorder not available; skipping statistics import for %s.",
-                    statistic_id,
-                )
-                return
-            last_stats = await recorder.async_add_executor_job(
-                get_last_statistics,
-                self.hass,
-                1,
+        last_stat_end_ts: float = 0.0
+        running_sum: float = 0.0
+        last_state: float | None = None
+        last_reset_ts: float | None = None
+
+        if last_stats and statistic_id in last_stats and last_stats[statistic_id]:
+            stats = last_stats[statistic_id][0]
+            last_stat_end_ts = stats.get("end") or 0.0
+            running_sum = stats.get("sum") or 0.0
+            last_state = stats.get("state")
+            last_reset_ts = stats.get("last_reset")
+            _LOGGER.debug(
+                "Found existing statistics for %s. Last timestamp: %s, Last sum: %s, Last state: %s",
+                statistic_id,
+                last_stat_end_ts,
+                running_sum,
+                last_state,
+            )
+        else:
+            _LOGGER.debug(
+                "No existing statistics found for %s. Will import all new readings.",
                 statistic_id,
-                True,
-                {"end", "state", "sum", "last_reset"},
             )
 
-            last_stat_end_ts: float = 0.0
-            running_sum: float = 0.0
-            last_state: float | None = None
-            last_reset_ts: float | None = None
-
-            if last_stats and statistic_id in last_stats and last_stats[statistic_id]:
-                stats = last_stats[statistic_id][0]
-                last_stat_end_ts = stats.get("end") or 0.0
-                running_sum = stats.get("sum") or 0.0
-                last_state = stats.get("state")
-                last_reset_ts = stats.get("last_reset")
-                _LOGGER.debug(
-                    "Found existing statistics for %s. Last timestamp: %s, Last sum: %s, Last state: %s",
-                    statistic_id,
-                    last_stat_end_ts,
-                    running_sum,
-                    last_state,
-                )
-            else:
-                _LOGGER.debug(
-                    "No existing statistics found for %s. Will import all new readings.",
-                    statistic_id,
-                )
+        # The coordinator keeps histories sorted by date, so the readings
+        # newer than the last statistic are a tail slice found by bisection.
+        history = device.history
+        first_new_index = bisect_right(
+            history,
+            dt_util.utc_from_timestamp(last_stat_end_ts),
+            key=reading_date,
+        )
+        new_readings = history[first_new_index:]
 
-            new_readings = sorted(
-                (r for r in device.history if r.date.timestamp() > last_stat_end_ts),
-                key=lambda r: r.date,
-            )
+        if not new_readings:
+            _LOGGER.debug("No new readings to import for %s.", statistic_id)
+            self._statistics_through = history[-1].date
+            self.async_fire_lts_updated()
+            return
 
-            if not new_readings:
-                _LOGGER.debug("No new readings to import for %s.", statistic_id)
-                self.hass.bus.async_fire(
-                    LTS_UPDATED_EVENT,
-                    {
-                        "statistic_id": statistic_id,
-                        "timestamp": dt_util.now().isoformat(),
-                    },
-                )
-                return
+        _LOGGER.debug(
+            "Found %d new readings to import as statistics for %s.",
+            len(new_readings),
+            statistic_id,
+        )
 
+        if last_reset_ts is None and new_readings:
+            first_reading_date = new_readings[0].date
+            last_reset_ts = first_reading_date.timestamp()
             _LOGGER.debug(
-                "Found %d new readings to import as statistics for %s.",
-                len(new_readings),
+                "Setting initial last_reset timestamp to %s for %s",
+                last_reset_ts,
                 statistic_id,
             )
 
-            if last_reset_ts is None and new_readings:
-                first_reading_date = new_readings[0].date
-                last_reset_ts = first_reading_date.timestamp()
-                _LOGGER.debug(
-                    "Setting initial last_reset timestamp to %s for %s",
-                    last_reset_ts,
-                    statistic_id,
-                )
+        device_name = _device_name(device, self._serial_number)
+        sensor_name = self.name or self._fallback_name
+
+        metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=f"{device_name} {sensor_name}",
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=self.entity_description.native_unit_of_measurement,
+            unit_class=self._unit_class,
+        )
 
-            device_name = device.location if device.location else f"Ista Device {self._serial_number[-4:]}"
-            _fallback_name = (
-                (self.entity_description.translation_key or self.entity_description.key)
-                .replace("_", " ")
-                .title()
-            )
-            sensor_name = self.name or _fallback_name
+        statistics_to_import: list[StatisticData] = []
 
-            _unit = self.entity_description.native_unit_of_measurement
-            if _unit == UnitOfEnergy.KILO_WATT_HOUR:
-                _unit_class = "energy"
-            elif _unit == UnitOfVolume.CUBIC_METERS:
-                _unit_class = "volume"
-            else:
-                _unit_class = None
-
-            metadata = StatisticMetaData(
-                mean_type=StatisticMeanType.NONE,
-                has_sum=True,
-                name=f"{device_name} {sensor_name}",
-                source=DOMAIN,
-                statistic_id=statistic_id,
-                unit_of_measurement=_unit,
-                unit_class=_unit_class,
+        # Determine the state *before* the first new reading.
+        if last_state is None and first_new_index > 0:
+            # If there's a reading in our history just before the new ones,
+            # use that as the baseline for calculating the first increase.
+            last_state = history[first_new_index - 1].reading
+            _LOGGER.debug(
+                "Initialized 'last_state' for sum calculation to %s from previous reading in history.",
+                last_state,
             )
 
-            statistics_to_import: list[StatisticData] = []
+        # This is the main logic correction.
+        is_first_import = last_state is None
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Converted once here and again only on a meter reset.
+        last_reset = dt_util.utc_from_timestamp(last_reset_ts) if last_reset_ts else None
 
-            # Determine the state *before* the first new reading.
-            if last_state is None:
-                try:
-                    history_dates: list[datetime] = [r.date for r in device.history]
-                    first_new_reading_idx = history_dates.index(new_readings[0].date)
-                    if first_new_reading_idx > 0:
-                        # If there's a reading in our history just before the new ones,
-                        # use that as the baseline for calculating the first increase.
-                        last_state = device.history[first_new_reading_idx - 1].reading
-                        _LOGGER.debug(
-                            "Initialized 'last_state' for sum calculation to %s from previous reading in history.",
-                            last_state,
-                        )
-                except (ValueError, IndexError):
-                    _LOGGER.debug(
-                        "Could not determine previous state for sum calculation. The first reading will establish the baseline."
-                    )
-                    pass
-
-            # This is the main logic correction.
-            is_first_import = last_state is None
-
-            for reading in new_readings:
-                if reading.reading is None:
+        for reading in new_readings:
+            if reading.reading is None:
+                if debug_enabled:
                     _LOGGER.debug("Skipping reading with None value.")
-                    continue
+                continue
 
-                current_state = reading.reading
+            current_state = reading.reading
 
-                # If this is the very first import for this sensor, the first reading's
-                # sum is 0, as it represents the starting point, not an increase.
-                if is_first_import:
-                    increase = 0.0
-                    is_first_import = (
-                        False  # Subsequent readings in this batch will be cumulative.
-                    )
-                else:
-                    increase = current_state - last_state
-
-                if increase < 0:
-                    _LOGGER.info(
-                        "Detected a meter reset for %s. Current reading (%s) is less than "
-                        "previous reading (%s). Resetting sum and last_reset timestamp.",
-                        statistic_id,
-                        current_state,
-                        last_state,
-                    )
-                    running_sum += current_state
-                    last_reset_ts = reading.date.timestamp()
-                else:
-                    running_sum += increase
-
-                statistics_to_import.append(
-                    StatisticData(
-                        start=reading.date,
-                        state=current_state,
-                        sum=running_sum,
-                        last_reset=(
-                            dt_util.utc_from_timestamp(last_reset_ts)
-                            if last_reset_ts
-                            else None
-                        ),
-                    )
+            # If this is the very first import for this sensor, the first reading's
+            # sum is 0, as it represents the starting point, not an increase.
+            if is_first_import:
+                increase = 0.0
+                is_first_import = (
+                    False  # Subsequent readings in this batch will be cumulative.
                 )
-                last_state = current_state
+            else:
+                increase = current_state - last_state
 
-            if statistics_to_import:
+            if increase < 0:
                 _LOGGER.info(
-                    "Importing %d new statistic(s) for %s.",
-                    len(statistics_to_import),
+                    "Detected a meter reset for %s. Current reading (%s) is less than "
+                    "previous reading (%s). Resetting sum and last_reset timestamp.",
                     statistic_id,
+                    current_state,
+                    last_state,
                 )
-                async_add_external_statistics(self.hass, metadata, statistics_to_import)
-                self.hass.bus.async_fire(
-                    LTS_UPDATED_EVENT,
-                    {
-                        "statistic_id": statistic_id,
-                        "timestamp": dt_util.now().isoformat(),
-                    },
+                running_sum += current_state
+                last_reset = dt_util.as_utc(reading.date)
+            else:
+                running_sum += increase
+
+            statistics_to_import.append(
+                StatisticData(
+                    start=reading.date,
+                    state=current_state,
+                    sum=running_sum,
+                    last_reset=last_reset,
                 )
-            _LOGGER.debug("Releasing statistics import lock for %s", statistic_id)
+            )
+            last_state = current_state
+
+        if statistics_to_import:
+            _LOGGER.info(
+                "Importing %d new statistic(s) for %s.",
+                len(statistics_to_import),
+                statistic_id,
+            )
+            for batch in batched(statistics_to_import, IMPORT_STATISTICS_BATCH_SIZE):
+                async_add_external_statistics(self.hass, metadata, list(batch))
+                # Let other work run between the chunks of a long backfill.
+                await asyncio.sleep(0)
+            self._statistics_through = history[-1].date
+            self.async_fire_lts_updated()
+
+    @callback
+    def async_fire_lts_updated(self) -> None:
+        """Notify the paired last-import sensor that the statistics are current."""
+        self.hass.bus.async_fire(
+            LTS_UPDATED_EVENT,
+            {
+                "statistic_id": self._statistic_id,
+                "timestamp": dt_util.now().isoformat(),
+            },
+        )
 
 
 class IstaLtsLastImportSensor(RestoreSensor):
@@ -850,8 +1029,7 @@ class IstaLtsLastImportSensor(RestoreSensor):
         self._attr_unique_id = f"{serial_number}_{key}_lts_last_import"
         self._attr_translation_key = "lts_last_import"
         self._attr_device_info = _make_device_info(device, serial_number)
-        sensor_unique_id = f"{serial_number}_{key}"
-        self._statistic_id = f"{DOMAIN}:{sensor_unique_id.replace('-', '_')}"
+        self._statistic_id = statistic_id(serial_number, key)
 
     async def async_added_to_hass(self) -> None:
         """Restore last state and subscribe to LTS update events."""
@@ -1,13 +1,18 @@
 """Tests for the config flow of ista_calista."""
 
+from datetime import date
 
+import pytest
 from homeassistant.config_entries import SOURCE_REAUTH, SOURCE_RECONFIGURE, SOURCE_USER
 from homeassistant.const import CONF_PASSWORD
 from homeassistant.data_entry_flow import FlowResultType
 from pycalista_ista import IstaApiError, IstaConnectionError, IstaLoginError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ista_calista.config_flow import get_default_offset_date
+from custom_components.ista_calista.config_flow import (
+    _months_before,
+    get_default_offset_date,
+)
 from custom_components.ista_calista.const import CONF_OFFSET, CONF_SEASON_START, DOMAIN
 
 from .const import MOCK_CONFIG
@@ -38,6 +43,21 @@ async def test_show_user_form_initial(recorder_mock, hass, enable_custom_integra
     assert offset_key.description["suggested_value"] == get_default_offset_date()
 
 
+
+@pytest.mark.parametrize(
+    ("day", "months", "expected"),
+    [
+        (date(2025, 6, 15), 12, date(2024, 6, 15)),
+        (date(2024, 2, 29), 12, date(2023, 2, 28)),
+        (date(2024, 3, 31), 1, date(2024, 2, 29)),
+        (date(2025, 1, 10), 1, date(2024, 12, 10)),
+    ],
+)
+def test_months_before(day: date, months: int, expected: date) -> None:
+    """Test month arithmetic clamps to the end of shorter months."""
+    assert _months_before(day, months) == expected
+
+
 async def test_user_flow_success(
     recorder_mock, hass, enable_custom_integrations, mock_pycalista
 ):
@@ -172,6 +192,8 @@ async def test_flow_abort_duplicate(
     )
     assert result2["type"] is FlowResultType.ABORT
     assert result2["reason"] == "already_configured"
+    # The duplicate is detected before any API call.
+    mock_pycalista.login.assert_not_awaited()
 
 
 async def test_reauth_flow_shows_password_form(
@@ -23,7 +23,7 @@ def test_domain_and_manufacturer():
 
 def test_platforms():
     """Test that the sensor platform is specified."""
-    assert isinstance(PLATFORMS, list)
+    assert isinstance(PLATFORMS, tuple)
     assert Platform.SENSOR in PLATFORMS
 
 
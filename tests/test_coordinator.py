@@ -1,11 +1,14 @@
 """Test the Ista Calista data update coordinator."""
 
+import asyncio
 import copy
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
+from homeassistant.config_entries import SOURCE_RECONFIGURE
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from pycalista_ista import IstaApiError, IstaConnectionError, IstaLoginError, Reading
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
@@ -26,7 +29,7 @@ async def test_initial_fetch(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     assert coordinator.last_update_success is True
     # Check that devices from MOCK_DEVICES are present
     assert set(coordinator.data["devices"].keys()) == set(MOCK_DEVICES.keys())
@@ -45,7 +48,7 @@ async def test_incremental_update_merging(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     # Prepare updated data with an additional reading for the heating device
     updated_heating = copy.deepcopy(initial_data["heating-123"])
     # Statistics timestamps must be at the top of the hour.
@@ -62,6 +65,53 @@ async def test_incremental_update_merging(
     assert any(r.reading == 1100.0 for r in coor_heating.history)
 
 
+async def test_incremental_fetch_covers_time_since_last_fetch(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that the incremental window starts 30 days before the last fetch."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    # Simulate an outage: the last successful fetch was long ago.
+    coordinator._last_fetch_date = date(2024, 3, 15)
+    coordinator._last_full_sync = None
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    await coordinator.async_refresh()
+
+    assert mock_pycalista.get_devices_history.call_args.kwargs["start"] == date(
+        2024, 2, 14
+    )
+    assert coordinator._last_fetch_date == dt_util.now().date()
+
+
+async def test_incremental_merge_keeps_history_sorted(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that merged readings are inserted in date order and replace same-date ones."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    updated_heating = copy.deepcopy(MOCK_DEVICES["heating-123"])
+    updated_heating.history = [
+        Reading(date=datetime(2024, 4, 1, 0, 0, tzinfo=timezone.utc), reading=1100.0),
+        Reading(date=datetime(2024, 2, 15, 0, 0, tzinfo=timezone.utc), reading=1060.0),
+        Reading(date=datetime(2024, 3, 1, 0, 0, tzinfo=timezone.utc), reading=1081.0),
+    ]
+    mock_pycalista.get_devices_history.return_value = {"heating-123": updated_heating}
+    await coordinator.async_refresh()
+
+    history = coordinator.data["devices"]["heating-123"].history
+    assert [r.reading for r in history] == [1000.0, 1050.5, 1060.0, 1081.0, 1100.0]
+
+
 async def test_incremental_update_adds_device(
     recorder_mock, caplog, hass, enable_custom_integrations, mock_pycalista
 ):
@@ -74,7 +124,7 @@ async def test_incremental_update_adds_device(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     assert len(coordinator.data["devices"]) == 1
 
     # API update now returns the original device plus a new one
@@ -102,7 +152,7 @@ async def test_incremental_update_no_change(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     # Subsequent API call returns the exact same data
     mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
 
@@ -114,6 +164,33 @@ async def test_incremental_update_no_change(
     assert "Removed" not in caplog.text
 
 
+async def test_update_interval_backs_off_while_idle(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that idle updates back off polling and new readings reset it."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    assert coordinator.update_interval == timedelta(hours=24)
+
+    for expected_hours in (48, 96, 168, 168):
+        mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+        await coordinator.async_refresh()
+        assert coordinator.update_interval == timedelta(hours=expected_hours)
+
+    updated_devices = copy.deepcopy(MOCK_DEVICES)
+    updated_devices["heating-123"].history.append(
+        Reading(date=datetime(2024, 4, 1, 0, 0, tzinfo=timezone.utc), reading=1100.0)
+    )
+    mock_pycalista.get_devices_history.return_value = updated_devices
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(hours=24)
+
+
 async def test_device_removal(
     recorder_mock, hass, enable_custom_integrations, mock_pycalista
 ):
@@ -124,10 +201,11 @@ async def test_device_removal(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     assert len(coordinator.data["devices"]) == 3
 
-    # API update now only returns the heating device
+    # The next day's full resync only returns the heating device
+    coordinator._last_full_sync = None
     updated_devices = {"heating-123": MOCK_DEVICES["heating-123"]}
     mock_pycalista.get_devices_history.return_value = updated_devices
     await coordinator.async_refresh()
@@ -138,6 +216,31 @@ async def test_device_removal(
     assert "heating-123" in coordinator.data["devices"]
     assert "hot-water-456" not in coordinator.data["devices"]
     assert "cold-water-789" not in coordinator.data["devices"]
+    assert coordinator.statistic_ids == {"ista_calista:heating_123_heating"}
+
+
+async def test_same_day_refresh_uses_narrow_window(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that a second poll on the same day fetches a narrow window only."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    mock_pycalista.get_devices_history.return_value = {
+        "heating-123": copy.deepcopy(MOCK_DEVICES["heating-123"])
+    }
+    await coordinator.async_refresh()
+
+    today = dt_util.now().date()
+    assert mock_pycalista.get_devices_history.call_args.kwargs["start"] == today - timedelta(
+        days=2
+    )
+    # Devices missing from a narrow window are kept until the next full resync.
+    assert set(coordinator.data["devices"]) == set(MOCK_DEVICES)
 
 
 @pytest.mark.parametrize(
@@ -153,13 +256,97 @@ async def test_update_errors(
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     # Simulate error on update
     mock_pycalista.get_devices_history.side_effect = error_cls("API error")
     await coordinator.async_refresh()
     assert coordinator.last_update_success is False
 
 
+async def test_update_relogs_in_after_session_expiry(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that an expired session is renewed once before failing the update."""
+    mock_pycalista.get_devices_history.return_value = MOCK_DEVICES
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    assert mock_pycalista.login.await_count == 1
+
+    mock_pycalista.get_devices_history.side_effect = [
+        IstaLoginError("session expired"),
+        copy.deepcopy(MOCK_DEVICES),
+    ]
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert mock_pycalista.login.await_count == 2
+
+
+async def test_concurrent_logins_share_one_attempt(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that concurrent callers await one login and all see its failure."""
+    mock_pycalista.get_devices_history.return_value = MOCK_DEVICES
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+    assert mock_pycalista.login.await_count == 1
+
+    mock_pycalista.login.side_effect = IstaLoginError("rejected")
+    results = await asyncio.gather(
+        coordinator.async_login(),
+        coordinator.async_login(),
+        return_exceptions=True,
+    )
+
+    assert mock_pycalista.login.await_count == 2
+    assert all(isinstance(result, IstaLoginError) for result in results)
+
+    # A finished attempt is not reused by later callers.
+    mock_pycalista.login.side_effect = None
+    await coordinator.async_login()
+    assert mock_pycalista.login.await_count == 3
+
+
+async def test_relogin_keeps_billing_data(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that billed readings and invoices survive a session renewal."""
+    mock_pycalista.get_devices_history.return_value = MOCK_DEVICES
+    mock_pycalista.get_billed_consumption.return_value = MOCK_BILLED_READINGS
+    mock_pycalista.get_invoice_xls.return_value = MOCK_INVOICES
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data
+
+    # Every call made with the expired session is rejected.
+    mock_pycalista.get_devices_history.side_effect = [
+        IstaLoginError("session expired"),
+        copy.deepcopy(MOCK_DEVICES),
+    ]
+    mock_pycalista.get_billed_consumption.side_effect = [
+        IstaLoginError("session expired"),
+        MOCK_BILLED_READINGS,
+    ]
+    mock_pycalista.get_invoice_xls.side_effect = [
+        IstaLoginError("session expired"),
+        MOCK_INVOICES,
+    ]
+    await coordinator.async_refresh()
+
+    assert coordinator.last_update_success is True
+    assert mock_pycalista.login.await_count == 2
+    assert coordinator.data["billed_readings"] == MOCK_BILLED_READINGS
+    assert coordinator.data["invoices"] == MOCK_INVOICES
+
+
 async def test_billing_fetch_failure_nonfatal(
     recorder_mock, hass, enable_custom_integrations, mock_pycalista
 ):
@@ -173,7 +360,7 @@ async def test_billing_fetch_failure_nonfatal(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     assert coordinator.last_update_success is True
     assert coordinator.data["billed_readings"] == []
     assert coordinator.data["invoices"] == []
@@ -192,7 +379,7 @@ async def test_billing_fetch_success(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     assert coordinator.last_update_success is True
     assert coordinator.data["billed_readings"] == MOCK_BILLED_READINGS
     assert coordinator.data["invoices"] == MOCK_INVOICES
@@ -235,7 +422,7 @@ async def test_coordinator_merging_edge_cases(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
     
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     assert coordinator.data["invoices"][0].invoice_id == "ID_123"
     
     # 2. Test case where detailed list has invoice that doesn't match XLS
@@ -254,3 +441,161 @@ async def test_coordinator_merging_edge_cases(
     
     assert len(coordinator.data["invoices"]) == 2
     assert any(i.invoice_id == "ID_EXTRA" for i in coordinator.data["invoices"])
+
+
+async def test_coordinator_merges_invoice_with_approximate_amount(
+    recorder_mock, hass: HomeAssistant, enable_custom_integrations, mock_pycalista
+):
+    """Test that an un-numbered invoice is matched to the XLS row by date, type and amount."""
+    from datetime import date as py_date
+
+    from pycalista_ista import Invoice
+
+    mock_pycalista.get_devices_history.return_value = MOCK_DEVICES
+    mock_pycalista.get_invoice_xls.return_value = [
+        Invoice(
+            invoice_number=None,
+            invoice_id=None,
+            invoice_date=py_date(2024, 1, 1),
+            device_type="heating",
+            amount=50.0,
+            period_start=py_date(2023, 1, 1),
+            period_end=py_date(2024, 1, 1),
+        )
+    ]
+    mock_pycalista.get_invoices.return_value = [
+        Invoice(
+            invoice_number=None,
+            invoice_id="ID_456",
+            invoice_date=py_date(2024, 1, 1),
+            device_type="heating",
+            amount=50.004,
+            period_start=None,
+            period_end=None,
+        )
+    ]
+
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data
+    assert len(coordinator.data["invoices"]) == 1
+    assert coordinator.data["invoices"][0].invoice_id == "ID_456"
+    assert coordinator.data["invoices"][0].period_start == py_date(2023, 1, 1)
+
+
+def _history_cache(entry_id: str, offset: str) -> dict:
+    """Build a stored history cache holding an older heating reading."""
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"ista_calista_history_{entry_id}",
+        "data": {
+            "email": MOCK_CONFIG["email"],
+            "offset": offset,
+            "last_fetch": "2024-03-15",
+            "devices": {
+                "heating-123": {
+                    "type": "HeatingDevice",
+                    "location": "Living Room",
+                    "history": [["2023-12-01T00:00:00+00:00", 950.0]],
+                }
+            },
+        },
+    }
+
+
+async def test_cold_start_seeded_from_history_cache(
+    recorder_mock, hass, hass_storage, enable_custom_integrations, mock_pycalista
+):
+    """Test that cached history is merged and only the tail window is fetched."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    hass_storage[f"ista_calista_history_{entry.entry_id}"] = _history_cache(
+        entry.entry_id, MOCK_CONFIG["consumption_offset_date"]
+    )
+    mock_pycalista.get_devices_history.return_value = {
+        "heating-123": copy.deepcopy(MOCK_DEVICES["heating-123"])
+    }
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_pycalista.get_devices_history.call_args.kwargs["start"] == date(
+        2024, 2, 14
+    )
+    history = entry.runtime_data.data["devices"]["heating-123"].history
+    assert [r.reading for r in history] == [950.0, 1000.0, 1050.5, 1080.0]
+
+
+async def test_cold_start_from_cache_keeps_update_interval(
+    recorder_mock, hass, hass_storage, enable_custom_integrations, mock_pycalista
+):
+    """Test that a seeded cold start without new readings does not back off."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    hass_storage[f"ista_calista_history_{entry.entry_id}"] = _history_cache(
+        entry.entry_id, MOCK_CONFIG["consumption_offset_date"]
+    )
+    # The fetched window only repeats the cached reading.
+    cached_device = copy.deepcopy(MOCK_DEVICES["heating-123"])
+    cached_device.history = [
+        Reading(date=datetime(2023, 12, 1, 0, 0, tzinfo=timezone.utc), reading=950.0)
+    ]
+    mock_pycalista.get_devices_history.return_value = {"heating-123": cached_device}
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.update_interval == timedelta(hours=24)
+
+
+async def test_history_cache_ignored_after_offset_change(
+    recorder_mock, hass, hass_storage, enable_custom_integrations, mock_pycalista
+):
+    """Test that a cache created for another offset date triggers a full fetch."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG)
+    hass_storage[f"ista_calista_history_{entry.entry_id}"] = _history_cache(
+        entry.entry_id, "2023-01-01"
+    )
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_pycalista.get_devices_history.call_args.kwargs["start"] == date(
+        2024, 1, 1
+    )
+    history = entry.runtime_data.data["devices"]["heating-123"].history
+    assert [r.reading for r in history] == [1000.0, 1050.5, 1080.0]
+
+
+async def test_history_cache_discarded_after_reconfigure(
+    recorder_mock, hass, hass_storage, enable_custom_integrations, mock_pycalista
+):
+    """Test that reconfiguring the offset date refetches from the new offset."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"].lower()
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_RECONFIGURE, "entry_id": entry.entry_id},
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={**MOCK_CONFIG, "consumption_offset_date": "2023-01-01"},
+    )
+    await hass.async_block_till_done()
+    assert result["reason"] == "reconfigure_successful"
+
+    # The snapshot written while unloading still belongs to the old offset.
+    stored = hass_storage[f"ista_calista_history_{entry.entry_id}"]["data"]
+    assert stored["offset"] == MOCK_CONFIG["consumption_offset_date"]
+    assert mock_pycalista.get_devices_history.call_args.kwargs["start"] == date(
+        2023, 1, 1
+    )
@@ -35,6 +35,14 @@ async def test_diagnostics(
     assert "devices" in diagnostics["api_data_summary"]
     assert len(diagnostics["api_data_summary"]["devices"]) == 3
     assert "serial_hash" in diagnostics["api_data_summary"]["devices"][0]
+    assert (
+        diagnostics["coordinator_status"]["last_update"] == "2024-03-01T00:00:00+00:00"
+    )
+    assert diagnostics["coordinator_status"]["statistic_ids"] == [
+        "ista_calista:cold_water_789_water",
+        "ista_calista:heating_123_heating",
+        "ista_calista:hot_water_456_hot_water",
+    ]
 
 
 async def test_diagnostics_no_data(
@@ -49,7 +57,7 @@ async def test_diagnostics_no_data(
     await hass.async_block_till_done()
 
     # Simulate a failed update where coordinator data is None
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     coordinator.data = None
     coordinator.last_update_success = False
 
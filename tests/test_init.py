@@ -9,7 +9,7 @@ from homeassistant.helpers import device_registry as dr
 from pycalista_ista import IstaApiError, IstaConnectionError, IstaLoginError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ista_calista.const import CONF_LOG_LEVEL, DOMAIN
+from custom_components.ista_calista.const import CONF_LOG_LEVEL, CONF_OFFSET, DOMAIN
 
 from .const import MOCK_CONFIG, MOCK_DEVICES
 
@@ -23,7 +23,7 @@ async def test_setup_entry_success(
     await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
     assert entry.state is ConfigEntryState.LOADED
-    assert entry.entry_id in hass.data[DOMAIN]
+    assert entry.runtime_data.ista is mock_pycalista
 
 
 async def test_setup_entry_invalid_auth(
@@ -38,6 +38,20 @@ async def test_setup_entry_invalid_auth(
     assert entry.state is ConfigEntryState.SETUP_ERROR
 
 
+async def test_setup_entry_invalid_offset_date(
+    recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that a malformed offset date fails setup without logging in."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={**MOCK_CONFIG, CONF_OFFSET: "not-a-date"}
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+    mock_pycalista.login.assert_not_awaited()
+
+
 async def test_setup_entry_connection_error(
     recorder_mock, hass, enable_custom_integrations, mock_pycalista
 ):
@@ -131,8 +145,8 @@ async def test_unload_entry(
     await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
     assert entry.state is ConfigEntryState.NOT_LOADED
-    # Also verify that integration-specific data is cleaned up
-    assert hass.data[DOMAIN] == {}
+    # Also verify that the API session is closed
+    mock_pycalista.close.assert_awaited_once()
 
 
 async def test_remove_entry_clears_stats(
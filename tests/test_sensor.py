@@ -123,9 +123,10 @@ async def test_sensor_unavailable_when_device_removed(
     assert heating_entity_id is not None
     assert hass.states.get(heating_entity_id).state != STATE_UNAVAILABLE
 
-    # Remove device data
+    # Remove device data in the next day's full resync
     mock_pycalista.get_devices_history.return_value = {}
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
+    coordinator._last_full_sync = None
     await coordinator.async_refresh()
     await hass.async_block_till_done()
 
@@ -152,7 +153,7 @@ async def test_sensor_unavailable_and_native_value(
     assert hass.states.get(sensor_entity_id).state != STATE_UNAVAILABLE
 
     # Remove the device from coordinator data to make the sensor unavailable
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     del coordinator.data["devices"]["heating-123"]
     coordinator.async_update_listeners()
     await hass.async_block_till_done()
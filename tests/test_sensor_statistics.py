@@ -237,3 +237,157 @@ async def test_statistics_meter_reset(
     )  # 55.5 (previous sum) + 10.0 (increase)
     assert stats_data[3]["state"] == 15.0
     assert stats_data[3]["last_reset"] == stats_data[2]["last_reset"]
+
+
+@patch("custom_components.ista_calista.sensor.async_add_external_statistics")
+async def test_statistics_import_batched_per_update(
+    mock_add_stats, recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that a coordinator update looks up all statistics in one batch."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"]
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    updated_devices = copy.deepcopy(MOCK_DEVICES)
+    for device in updated_devices.values():
+        device.history.append(
+            Reading(
+                date=datetime(2024, 4, 1, 0, 0, tzinfo=timezone.utc),
+                reading=device.history[-1].reading + 1,
+            )
+        )
+    mock_pycalista.get_devices_history.return_value = updated_devices
+
+    with patch(
+        "custom_components.ista_calista.sensor._get_last_statistics_batch",
+        return_value={},
+    ) as mock_batch:
+        await entry.runtime_data.async_refresh()
+        await hass.async_block_till_done()
+
+    mock_batch.assert_called_once()
+    assert sorted(mock_batch.call_args.args[1]) == [
+        "ista_calista:cold_water_789_water",
+        "ista_calista:heating_123_heating",
+        "ista_calista:hot_water_456_hot_water",
+    ]
+
+
+@patch("custom_components.ista_calista.sensor.async_add_external_statistics")
+async def test_statistics_import_skipped_when_history_unchanged(
+    mock_add_stats, recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that an update without new readings skips the recorder lookup."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"]
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert mock_add_stats.call_count == 3
+
+    with patch(
+        "custom_components.ista_calista.sensor._get_last_statistics_batch",
+        return_value={},
+    ) as mock_batch:
+        await entry.runtime_data.async_refresh()
+        await hass.async_block_till_done()
+
+    mock_batch.assert_not_called()
+    assert mock_add_stats.call_count == 3
+
+
+@patch("custom_components.ista_calista.sensor.IMPORT_STATISTICS_BATCH_SIZE", 2)
+@patch("custom_components.ista_calista.sensor.async_add_external_statistics")
+async def test_statistics_import_in_batches(
+    mock_add_stats, recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that a backfill is handed to the recorder in fixed-size chunks."""
+    mock_pycalista.get_devices_history.return_value = {
+        "heating-123": copy.deepcopy(MOCK_DEVICES["heating-123"])
+    }
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"]
+    )
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    batches = [call.args[2] for call in mock_add_stats.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [stat["sum"] for stat in batches[1]] == [80.0]
+
+
+@patch("custom_components.ista_calista.sensor.async_add_external_statistics")
+async def test_statistics_import_batched_at_startup(
+    mock_add_stats, recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that the initial imports of all sensors share one lookup."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"]
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.ista_calista.sensor._get_last_statistics_batch",
+        return_value={},
+    ) as mock_batch:
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    mock_batch.assert_called_once()
+    assert len(mock_batch.call_args.args[1]) == 3
+    assert mock_add_stats.call_count == 3
+
+
+@patch("custom_components.ista_calista.sensor.async_add_external_statistics")
+async def test_statistics_import_failure_isolated_per_sensor(
+    mock_add_stats, recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that one failing sensor does not stop the other imports."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"]
+    )
+    entry.add_to_hass(hass)
+
+    def _add_stats(hass, metadata, statistics):
+        if metadata["statistic_id"] == "ista_calista:heating_123_heating":
+            raise ValueError("bad statistics")
+
+    mock_add_stats.side_effect = _add_stats
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_add_stats.call_count == 3
+
+
+@patch("custom_components.ista_calista.sensor.async_add_external_statistics")
+async def test_statistics_import_batch_lookup_failure(
+    mock_add_stats, recorder_mock, hass, enable_custom_integrations, mock_pycalista
+):
+    """Test that a failed batched lookup falls back to one lookup per sensor."""
+    mock_pycalista.get_devices_history.return_value = copy.deepcopy(MOCK_DEVICES)
+    entry = MockConfigEntry(
+        domain=DOMAIN, data=MOCK_CONFIG, unique_id=MOCK_CONFIG["email"]
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.ista_calista.sensor._get_last_statistics_batch",
+        side_effect=[RuntimeError("database locked"), {}, {}, {}],
+    ) as mock_batch:
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert mock_batch.call_count == 4
+    assert mock_add_stats.call_count == 3
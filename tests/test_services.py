@@ -98,7 +98,7 @@ async def test_download_invoice_empty_data(
     await hass.async_block_till_done()
     
     # Manually clear data 
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
     coordinator.data = {}
 
     with pytest.raises(ServiceValidationError, match="not found in the local cache"):